@@ -1,10 +1,12 @@
-from flask import Flask, jsonify, send_from_directory
+from flask import Flask, jsonify, send_file, send_from_directory
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 import os
 
+from app.json_provider import OrjsonProvider
+
 db = SQLAlchemy()
 migrate = Migrate()
 jwt = JWTManager()
@@ -13,13 +15,16 @@ jwt = JWTManager()
 def create_app():
     root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     dist_dir = os.path.join(root_dir, "frontend", "dist")
-    has_frontend = os.path.exists(os.path.join(dist_dir, "index.html"))
+    index_file = os.path.join(dist_dir, "index.html")
+    has_frontend = os.path.exists(index_file)
 
     if has_frontend:
         app = Flask(__name__, static_folder=dist_dir, static_url_path="/")
     else:
         app = Flask(__name__)
 
+    app.json = OrjsonProvider(app)
+
     frontend_url = os.environ.get("FRONTEND_URL")
     if frontend_url:
         CORS(app, origins=[frontend_url])
@@ -36,6 +41,10 @@ def create_app():
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["UPLOAD_FOLDER"] = upload_dir
 
+    max_upload_mb = os.environ.get("MAX_UPLOAD_MB")
+    if max_upload_mb:
+        app.config["MAX_CONTENT_LENGTH"] = int(max_upload_mb) * 1024 * 1024
+
     db.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
@@ -56,7 +65,7 @@ def create_app():
             file_path = os.path.join(dist_dir, path)
             if path and os.path.exists(file_path):
                 return send_from_directory(dist_dir, path)
-            return send_from_directory(dist_dir, "index.html")
+            return send_file(index_file)
 
     with app.app_context():
         db.create_all()
@@ -3,6 +3,7 @@ from werkzeug.security import generate_password_hash, check_password_hash
 from app import db
 from app.models import User
 from flask_jwt_extended import create_access_token
+from sqlalchemy import select
 
 auth_bp = Blueprint("auth", __name__)
 
@@ -17,7 +18,7 @@ def register():
     if not username or not password:
         return jsonify({"msg": "Username and password are required"}), 400
 
-    if User.query.filter_by(username=username).first():
+    if db.session.scalar(select(User.id).filter_by(username=username).exists().select()):
         return jsonify({"msg": "Username already exists"}), 400
 
     user = User(
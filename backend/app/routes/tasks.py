@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required
+from sqlalchemy import select
 from app import db
 from app.models import Task, Attachment
 import os
@@ -10,22 +11,23 @@ task_bp = Blueprint("tasks", __name__)
 @task_bp.route("/", methods=["GET"])
 @jwt_required()
 def list_tasks():
-    tasks = Task.query.order_by(Task.id.desc()).all()
-    return jsonify(
-        [
-            {
-                "id": t.id,
-                "title": t.title,
-                "status": t.status,
-                "description": t.description,
-                "assigned_to_id": t.assigned_to_id,
-                "assigned_by_id": t.assigned_by_id,
-                "created_at": t.created_at.isoformat() if t.created_at else None,
-                "completed_at": t.completed_at.isoformat() if t.completed_at else None,
-            }
-            for t in tasks
-        ]
-    )
+    rows = db.session.execute(
+        select(
+            Task.id,
+            Task.title,
+            Task.status,
+            Task.description,
+            Task.assigned_to_id,
+            Task.assigned_by_id,
+            Task.created_at,
+            Task.completed_at,
+        ).order_by(Task.id.desc())
+    ).mappings()
+    # The JSON provider encodes datetimes as ISO 8601 natively.
+    response = jsonify([dict(row) for row in rows])
+    # The ETag is a hash of the body, so a 304 always means identical content.
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 @task_bp.route("/", methods=["POST"])
@@ -44,8 +46,10 @@ def create_task():
         assigned_by_id=data.get("assigned_by_id"),
     )
     db.session.add(task)
+    db.session.flush()
+    task_id = task.id
     db.session.commit()
-    return jsonify({"msg": "Task created", "id": task.id})
+    return jsonify({"msg": "Task created", "id": task_id})
 
 
 @task_bp.route("/<int:task_id>/upload", methods=["POST"])
@@ -60,7 +64,7 @@ def upload_file(task_id):
 
     filename = file.filename
     path = os.path.join(current_app.config["UPLOAD_FOLDER"], filename)
-    file.save(path)
+    file.save(path, buffer_size=1024 * 1024)
 
     att = Attachment(task_id=task_id, file_path=filename)
     db.session.add(att)